@@ -0,0 +1,45 @@
+import unittest
+from urllib.parse import quote_plus
+
+from transliterate_utils import extract_video_id, pack_chunks
+
+
+class ExtractVideoIdTest(unittest.TestCase):
+    def test_watch_and_short_urls(self):
+        self.assertEqual(extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42"), "dQw4w9WgXcQ")
+        self.assertEqual(extract_video_id("https://youtu.be/dQw4w9WgXcQ"), "dQw4w9WgXcQ")
+
+    def test_invalid_url(self):
+        self.assertIsNone(extract_video_id("not a url"))
+
+
+class PackChunksTest(unittest.TestCase):
+    def test_malayalam_chunks_fit_both_limits(self):
+        text = " ".join(["മലയാളം"] * 2000)
+        chunks = pack_chunks(text)
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 4500)
+            self.assertLessEqual(len(quote_plus(chunk)), 12000)
+        self.assertEqual(" ".join(chunks), text)
+
+    def test_indic_text_needs_fewer_requests_than_fixed_slices(self):
+        text = " ".join(["മലയാളം", "தமிழ்", "తెలుగు"] * 4000)
+        fixed_slices = -(-len(text) // 500)
+        self.assertLess(len(pack_chunks(text)), fixed_slices)
+
+    def test_ascii_chunks_respect_character_limit(self):
+        text = " ".join(["word"] * 3000)
+        chunks = pack_chunks(text)
+        self.assertEqual(len(chunks), 4)
+        self.assertTrue(all(len(chunk) <= 4500 for chunk in chunks))
+
+    def test_ascii_text_fits_in_one_chunk(self):
+        self.assertEqual(pack_chunks("hello   world\nagain"), ["hello world again"])
+
+    def test_empty_text(self):
+        self.assertEqual(pack_chunks(""), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
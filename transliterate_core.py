@@ -0,0 +1,154 @@
+import streamlit as st
+from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
+import deep_translator.google
+from deep_translator import GoogleTranslator
+from deep_translator.exceptions import TooManyRequests, RequestError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import random
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from transliterate_utils import pack_chunks
+
+logger = logging.getLogger(__name__)
+
+# Stand-in for the requests module that sends deep_translator's GETs through a shared session
+class _SessionRequests:
+    def __init__(self, session):
+        self._session = session
+
+    def get(self, *args, **kwargs):
+        return self._session.get(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+# Shared HTTP session so translation calls reuse keep-alive connections instead of paying a
+# TLS handshake per chunk. Cached as a resource so it survives reruns and is shared by all users.
+@st.cache_resource
+def get_http_session():
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0))
+    return session
+
+# Function to route deep_translator's requests.get calls through the shared session.
+# Installed on first translation rather than at import, and safe to call repeatedly.
+def _install_shared_session():
+    if not isinstance(deep_translator.google.requests, _SessionRequests):
+        deep_translator.google.requests = _SessionRequests(get_http_session())
+
+# Function to fetch the transcript text, cached so repeat runs skip the YouTube download.
+# Only the plain string is cached; Transcript objects hold an HTTP session and don't pickle reliably.
+@st.cache_data(ttl=3600, max_entries=500, show_spinner=False)
+def get_source_text(video_id, source_language):
+    logger.debug("Fetching subtitles for video ID: %s and source language: %s", video_id, source_language)
+    try:
+        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+        transcript_data = transcript_list.find_generated_transcript([source_language]).fetch()
+    except (TranscriptsDisabled, VideoUnavailable, NoTranscriptFound) as e:
+        logger.warning("Error fetching subtitles: %s. Subtitles might be disabled or unavailable.", e)
+        return None
+    return " ".join([entry['text'] for entry in transcript_data])
+
+# Function to translate a single chunk, retrying with exponential backoff on failure
+def _translate_with_retry(translator, chunk, stop, attempts=3):
+    for attempt in range(attempts):
+        if stop.is_set():
+            return None
+        try:
+            return translator.translate(text=chunk)
+        except TooManyRequests as e:
+            # Rate limited: back off harder than for transient errors
+            error, delay = e, min(2 * (2 ** attempt) + random.random(), 8.0)
+        except requests.exceptions.ConnectionError as e:
+            # Dropped or reset connection: retry straight away
+            error, delay = e, 0
+        except (requests.exceptions.RequestException, RequestError) as e:
+            error, delay = e, min(0.5 * (2 ** attempt) + random.random() * 0.5, 4.0)
+        logger.warning("Translation error: %s. Retrying...", error)
+        if attempt < attempts - 1:
+            # Waits like time.sleep but wakes as soon as another chunk has failed
+            stop.wait(delay)
+    return None
+
+# Function to translate text, cached per (source_text, source_language, target_language) so
+# repeat runs skip the Google Translate calls. Failures raise instead of returning, so they aren't cached.
+@st.cache_data(ttl=86400, max_entries=500, show_spinner=False)
+def translate_text(source_text, source_language, target_language):
+    # Translate in chunks to avoid errors; never split a word across chunks
+    chunks = pack_chunks(source_text)
+    _install_shared_session()
+    results = [None] * len(chunks)
+    stop = threading.Event()
+
+    # Created inside the cached function so Streamlit can replay it on a cache hit
+    progress = st.progress(0.0, text="Translating…")
+
+    # Translate chunks concurrently and report progress as each one finishes. Each call gets its
+    # own translator since GoogleTranslator.translate stores the request params on the instance.
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(
+                    _translate_with_retry,
+                    GoogleTranslator(source=source_language, target=target_language), chunk, stop): index
+                for index, chunk in enumerate(chunks)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                # Stop at the first failed chunk: cancel everything still queued and tell in-flight
+                # chunks not to retry, rather than keep hitting an API that is failing or rate limiting us
+                try:
+                    result = future.result()
+                except Exception:
+                    stop.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                if result is None:
+                    stop.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise RuntimeError("Failed to translate some parts of the subtitles after multiple retries.")
+                results[futures[future]] = result
+                progress.progress(done / len(chunks), text=f"Translated {done} of {len(chunks)} chunks")
+    finally:
+        progress.empty()
+
+    return "\n".join(results)
+
+# Function to fetch and translate subtitles
+def fetch_and_translate_subtitles(video_id, source_language='ml', target_language='en'):
+    logger.debug("Fetching and translating subtitles for video ID: %s", video_id)
+
+    try:
+        source_text = get_source_text(video_id, source_language)
+        if source_text is None:
+            st.error(f"Could not retrieve subtitles for video ID: {video_id}. Subtitles might be disabled or unavailable.")
+            logger.error("Could not retrieve subtitles for video ID: %s. Subtitles might be disabled or unavailable.", video_id)
+            return
+
+        # Display original subtitles
+        st.text_area("Original Subtitles", source_text, height=150)
+
+        try:
+            translated_text = translate_text(source_text, source_language, target_language)
+        except RuntimeError as e:
+            logger.error("%s", e)
+            st.error(str(e))
+            return
+
+        # Ensure full translation has been done
+        if translated_text.strip():
+            st.text_area("Translated Subtitles", translated_text, height=150)
+            st.download_button("Download Original Subtitles", source_text, file_name=f"{video_id}_original.txt")
+            st.download_button("Download Translated Subtitles", translated_text, file_name=f"{video_id}_translated.txt")
+            st.success("Translation completed successfully!")
+            logger.info("Translation completed successfully!")
+        else:
+            logger.error("Translation resulted in empty text. Please check the translation API or input.")
+            st.error("Translation resulted in empty text. Please check the translation API or input.")
+        return
+
+    except Exception as e:
+        logger.error("An unexpected error occurred in fetch_and_translate_subtitles: %s", e)
+        st.error(f"An unexpected error occurred: {e}")
@@ -0,0 +1,49 @@
+import re
+import logging
+from urllib.parse import quote_plus
+
+logger = logging.getLogger(__name__)
+
+# Languages offered in the UI, keyed by language code
+language_options = {
+    'ml': 'Malayalam (ml)',
+    'ta': 'Tamil (ta)',
+    'te': 'Telugu (te)',
+    'hi': 'Hindi (hi)',
+    'en': 'English (en)'
+}
+
+# Pattern for the 11-character YouTube video ID, compiled once at import
+_VIDEO_ID_RE = re.compile(r"(?:v=|\/)([0-9A-Za-z_-]{11})")
+
+# Function to extract YouTube video ID from URL
+def extract_video_id(url):
+    logger.debug("Extracting video ID from URL: %s", url)
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        video_id = match.group(1)
+        logger.debug("Extracted video ID: %s", video_id)
+        return video_id
+    else:
+        logger.error("Failed to extract video ID. Invalid URL format.")
+        return None
+
+# Function to pack text into chunks of whole words. deep_translator sends each chunk in the query
+# string of a GET request, so besides its 5000-character input limit a chunk must keep the URL under
+# Google's ~16 KB request limit; every Malayalam, Tamil or Telugu character encodes to 9 bytes.
+def pack_chunks(text, max_chars=4500, max_encoded_length=12000):
+    chunks, current, current_chars, current_encoded = [], [], 0, 0
+    for word in text.split():
+        word_encoded = len(quote_plus(word))
+        separator = 1 if current else 0
+        if current and (current_chars + separator + len(word) > max_chars
+                        or current_encoded + separator + word_encoded > max_encoded_length):
+            chunks.append(" ".join(current))
+            current, current_chars, current_encoded = [word], len(word), word_encoded
+        else:
+            current.append(word)
+            current_chars += separator + len(word)
+            current_encoded += separator + word_encoded
+    if current:
+        chunks.append(" ".join(current))
+    return chunks